@@ -13,16 +13,77 @@ Usage:
 """
 
 import argparse
+import asyncio
 import boto3
+import logging
 import sys
-from datetime import datetime, timezone
-from typing import List, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
 
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None  # Only needed for --async
+
+
+# Per-LB scan progress goes here (stderr); summaries stay on stdout via print
+logger = logging.getLogger('lb-cleaner')
+
+# Upper bound (seconds) on reusing a target health result within a single scan; the cache
+# is cleared at the start of every scan, so results never carry over between scans
+_CACHE_TTL = 1200
+
+# Maximum number of load balancers a single DescribeTags call accepts
+_DESCRIBE_TAGS_BATCH_SIZE = 20
+
+# Maximum in-flight requests for the --async scan
+_ASYNC_CONCURRENCY = 32
+
+# Target health states that mean a target group is still in use (the API returns them lowercase)
+_ACTIVE_STATES = frozenset({'healthy', 'initial', 'draining'})
+
+
+def _client_config(max_pool_connections: int) -> Config:
+    """
+    Timeouts and adaptive retries shared by the boto3 and aioboto3 ELB clients.
+    
+    Adaptive retries back off client-side when the ELB describe APIs start throttling.
+    """
+    return Config(
+        max_pool_connections=max_pool_connections,
+        connect_timeout=5,
+        read_timeout=15,
+        retries={'mode': 'adaptive', 'max_attempts': 10}
+    )
+
+
+@dataclass
+class ScanStats:
+    """
+    Outcome of scanning one kind of load balancer (ELBv2 or Classic).
+    
+    no_tag only counts LBs that reached the tag check, i.e. old enough and not already
+    known to be in use; young or in-use LBs are never tag-checked.
+    """
+    label: str
+    inactive: List[Dict] = field(default_factory=list)
+    too_new: List[Tuple[str, float]] = field(default_factory=list)
+    total: int = 0
+    no_created: int = 0
+    no_tag: int = 0
+
 
 class LoadBalancerCleaner:
     def __init__(self, region: str, dry_run: bool = True, min_age_days: int = 2, 
-                 filter_tag_key: Optional[str] = None, filter_tag_value: Optional[str] = None):
+                 filter_tag_key: Optional[str] = None, filter_tag_value: Optional[str] = None,
+                 max_workers: int = 10, use_async: bool = False):
         """
         Initialize the load balancer cleaner.
         
@@ -32,28 +93,79 @@ class LoadBalancerCleaner:
             min_age_days: Minimum age in days for a load balancer to be eligible for deletion
             filter_tag_key: Tag key to filter on (e.g., 'Owner')
             filter_tag_value: Tag value to filter on (e.g., 'ex_admin@cloudera.com')
+            max_workers: Number of threads used to check load balancers concurrently
+            use_async: If True, check ELBv2 target health with aioboto3 instead of threads
         """
         self.region = region
         self.dry_run = dry_run
         self.min_age_days = min_age_days
         self.filter_tag_key = filter_tag_key
         self.filter_tag_value = filter_tag_value
+        self.max_workers = max_workers
+        self.use_async = use_async
+        # Anything created at or before this instant is old enough to delete
+        self._cutoff = datetime.now(timezone.utc) - timedelta(days=min_age_days)
+        
+        # TG ARN -> (fetched_at, is_active), shared by LBs with a common target group within
+        # one scan and reset by find_and_delete_inactive_lbs
+        self._tg_health_cache: Dict[str, Tuple[float, bool]] = {}
+        self._cache_lock = threading.Lock()
+        # Per target group locks so LBs sharing a TG trigger only one DescribeTargetHealth
+        self._tg_health_locks: Dict[str, threading.Lock] = {}
+        
+        # Target health lookups for one LB's target groups run on their own pool, created on
+        # first use; sharing the per-LB pool would deadlock once every worker is waiting on its
+        # own sub-tasks
+        self._health_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Size the connection pool so every worker thread (both pools) gets its own kept-alive
+        # connection
+        client_config = _client_config(max(2 * max_workers, 10)).merge(Config(tcp_keepalive=True))
+        # The Tagging API is only an optimisation: if it's unreachable (e.g. private
+        # cluster) give up quickly and fall back to DescribeTags instead of retrying
+        tagging_config = Config(
+            connect_timeout=2,
+            read_timeout=15,
+            retries={'max_attempts': 2}
+        )
         
         try:
-            self.elbv2_client = boto3.client('elbv2', region_name=region)
-            self.elb_client = boto3.client('elb', region_name=region)
+            # One session so all clients share a single credential resolver
+            session = boto3.session.Session(region_name=region)
+            self.elbv2_client = session.client('elbv2', config=client_config)
+            self.elb_client = session.client('elb', config=client_config)
+            self.tagging_client = session.client('resourcegroupstaggingapi', config=tagging_config)
         except Exception as e:
             print(f"Error initializing AWS clients: {e}")
             sys.exit(1)
     
-    def get_all_load_balancers_v2(self) -> List[Dict]:
-        """Get all Application and Network Load Balancers (ELBv2)."""
+    def get_all_load_balancers_v2(self) -> Iterator[Dict]:
+        """Yield all Application and Network Load Balancers (ELBv2), page by page."""
         try:
-            response = self.elbv2_client.describe_load_balancers()
-            return response.get('LoadBalancers', [])
+            paginator = self.elbv2_client.get_paginator('describe_load_balancers')
+            for page in paginator.paginate(PaginationConfig={'PageSize': 400}):
+                yield from page.get('LoadBalancers', [])
         except ClientError as e:
-            print(f"Error listing ELBv2 load balancers: {e}")
-            return []
+            logger.error("Error listing ELBv2 load balancers: %s", e)
+    
+    def _cache_get(self, cache: Dict, key: str):
+        """Return a cached result for key if it is younger than _CACHE_TTL, else None."""
+        with self._cache_lock:
+            entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _cache_put(self, cache: Dict, key: str, value) -> None:
+        """Store a result in cache with the current timestamp."""
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), value)
+    
+    def _reset_caches(self) -> None:
+        """Forget all target health results so a scan never acts on stale data."""
+        with self._cache_lock:
+            self._tg_health_cache.clear()
+            self._tg_health_locks.clear()
     
     def get_target_groups_for_lb(self, load_balancer_arn: str) -> List[Dict]:
         """Get all target groups associated with a load balancer."""
@@ -63,33 +175,68 @@ class LoadBalancerCleaner:
             )
             return response.get('TargetGroups', [])
         except ClientError as e:
-            print(f"Error getting target groups for {load_balancer_arn}: {e}")
+            logger.error("Error getting target groups for %s: %s", load_balancer_arn, e)
             return []
     
+    @staticmethod
+    def _targets_are_active(targets: List[Dict]) -> bool:
+        """Check a DescribeTargetHealth result for any healthy, initial, or draining targets."""
+        return any(target['TargetHealth'].get('State') in _ACTIVE_STATES for target in targets)
+    
     def has_active_targets(self, target_group_arn: str) -> bool:
         """Check if a target group has any healthy or draining targets."""
+        cached = self._cache_get(self._tg_health_cache, target_group_arn)
+        if cached is not None:
+            return cached
+        
+        with self._cache_lock:
+            tg_lock = self._tg_health_locks.get(target_group_arn)
+            if tg_lock is None:
+                tg_lock = self._tg_health_locks[target_group_arn] = threading.Lock()
+        with tg_lock:
+            # Another worker may have fetched it while we waited
+            cached = self._cache_get(self._tg_health_cache, target_group_arn)
+            if cached is not None:
+                return cached
+            return self._fetch_target_health(target_group_arn)
+    
+    def _fetch_target_health(self, target_group_arn: str) -> bool:
+        """Query DescribeTargetHealth for a target group and cache whether it is active."""
         try:
             response = self.elbv2_client.describe_target_health(
                 TargetGroupArn=target_group_arn
             )
-            targets = response.get('TargetHealthDescriptions', [])
-            
-            # Check for any targets that are healthy, initial, or draining
-            active_states = ['healthy', 'initial', 'draining']
-            for target in targets:
-                state = target.get('TargetHealth', {}).get('State', '').lower()
-                if state in active_states:
-                    return True
-            return False
+            is_active = self._targets_are_active(response.get('TargetHealthDescriptions', []))
+            self._cache_put(self._tg_health_cache, target_group_arn, is_active)
+            return is_active
         except ClientError as e:
-            print(f"Error checking target health for {target_group_arn}: {e}")
+            logger.error("Error checking target health for %s: %s", target_group_arn, e)
             return False
     
+    @staticmethod
+    def _state_verdict(load_balancer: Dict) -> Optional[bool]:
+        """
+        Decide inactivity from the LB state in the describe response, if possible.
+        
+        Returns:
+            True/False when the state alone decides it, None if target health is needed
+        """
+        state = load_balancer.get('State', {}).get('Code')
+        if state == 'failed':
+            return True
+        if state == 'provisioning':
+            return False  # Targets may not be registered yet
+        return None
+    
     def is_elbv2_inactive(self, load_balancer: Dict) -> bool:
         """
         Check if an ELBv2 load balancer is inactive.
         A load balancer is inactive if it has no active targets in any target group.
         """
+        verdict = self._state_verdict(load_balancer)
+        if verdict is not None:
+            return verdict
+        
         lb_arn = load_balancer['LoadBalancerArn']
         target_groups = self.get_target_groups_for_lb(lb_arn)
         
@@ -97,21 +244,121 @@ class LoadBalancerCleaner:
         if not target_groups:
             return True
         
-        # Check if any target group has active targets
-        for tg in target_groups:
-            if self.has_active_targets(tg['TargetGroupArn']):
+        if len(target_groups) == 1:
+            return not self.has_active_targets(target_groups[0]['TargetGroupArn'])
+        
+        # Check all target groups concurrently; inactive only if none has active targets
+        results = self._get_health_executor().map(
+            self.has_active_targets, [tg['TargetGroupArn'] for tg in target_groups]
+        )
+        return not any(results)
+    
+    def _get_health_executor(self) -> ThreadPoolExecutor:
+        """Return the target health pool, creating it on first use."""
+        with self._cache_lock:
+            if self._health_executor is None:
+                self._health_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._health_executor
+    
+    def _shutdown_health_executor(self) -> None:
+        """Stop the target health pool's threads; the next lookup creates a fresh one."""
+        with self._cache_lock:
+            executor, self._health_executor = self._health_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def _check_elbv2(self, load_balancer: Dict) -> Tuple[Dict, bool, float]:
+        """Worker for the thread pool: returns (load_balancer, is_inactive, age_days)."""
+        is_inactive = self.is_elbv2_inactive(load_balancer)
+        return load_balancer, is_inactive, self.get_age_days(load_balancer['CreatedTime'])
+    
+    async def _is_elbv2_inactive_async(self, elbv2, semaphore: asyncio.Semaphore,
+                                       inflight: Dict[str, asyncio.Task],
+                                       load_balancer: Dict) -> bool:
+        """aioboto3 counterpart of is_elbv2_inactive, sharing the same target health cache."""
+        verdict = self._state_verdict(load_balancer)
+        if verdict is not None:
+            return verdict
+        
+        lb_arn = load_balancer['LoadBalancerArn']
+        try:
+            async with semaphore:
+                response = await elbv2.describe_target_groups(LoadBalancerArn=lb_arn)
+            target_groups = response.get('TargetGroups', [])
+        except ClientError as e:
+            logger.error("Error getting target groups for %s: %s", lb_arn, e)
+            target_groups = []
+        
+        # If no target groups, consider it inactive
+        if not target_groups:
+            return True
+        
+        async def tg_is_active(tg_arn: str) -> bool:
+            cached = self._cache_get(self._tg_health_cache, tg_arn)
+            if cached is not None:
+                return cached
+            try:
+                async with semaphore:
+                    response = await elbv2.describe_target_health(TargetGroupArn=tg_arn)
+                is_active = self._targets_are_active(response.get('TargetHealthDescriptions', []))
+                self._cache_put(self._tg_health_cache, tg_arn, is_active)
+                return is_active
+            except ClientError as e:
+                logger.error("Error checking target health for %s: %s", tg_arn, e)
                 return False
         
-        return True
+        # Share one in-flight lookup per target group across all LBs in the scan
+        tasks = []
+        for tg in target_groups:
+            tg_arn = tg['TargetGroupArn']
+            if tg_arn not in inflight:
+                inflight[tg_arn] = asyncio.ensure_future(tg_is_active(tg_arn))
+            tasks.append(inflight[tg_arn])
+        results = await asyncio.gather(*tasks)
+        return not any(results)
+    
+    async def _check_elbv2_all_async(self, load_balancers: List[Dict]) -> List[Tuple[Dict, bool, float]]:
+        """Check all ELBv2 candidates on one event loop; returns (load_balancer, is_inactive, age_days)."""
+        semaphore = asyncio.Semaphore(_ASYNC_CONCURRENCY)
+        inflight: Dict[str, asyncio.Task] = {}
+        session = aioboto3.Session(region_name=self.region)
+        async with session.client('elbv2', config=_client_config(_ASYNC_CONCURRENCY)) as elbv2:
+            async def check(lb: Dict) -> Tuple[Dict, bool, float]:
+                is_inactive = await self._is_elbv2_inactive_async(elbv2, semaphore, inflight, lb)
+                return lb, is_inactive, self.get_age_days(lb['CreatedTime'])
+            
+            return await asyncio.gather(*(check(lb) for lb in load_balancers))
+    
+    def _check_elbv2_all(self, load_balancers: Iterable[Dict]) -> List[Tuple[Dict, bool, float]]:
+        """
+        Check ELBv2 candidates for inactivity; returns (load_balancer, is_inactive, age_days).
+        
+        Target health lookups are network-bound, so each LB is submitted to the pool as it
+        arrives and the checks run while pagination and tag checks continue.
+        """
+        if self.use_async:
+            return asyncio.run(self._check_elbv2_all_async(list(load_balancers)))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._check_elbv2, lb) for lb in load_balancers]
+            return [future.result() for future in futures]
+    
+    @staticmethod
+    def _describe(load_balancer: Dict) -> str:
+        """Short description of a load balancer for progress output."""
+        lb_name = load_balancer.get('LoadBalancerName', 'Unknown')
+        if 'LoadBalancerArn' not in load_balancer:
+            return lb_name  # Classic ELBs are identified by name alone
+        lb_type = load_balancer.get('Type', 'Unknown')
+        return f"{lb_name} ({lb_type}) - {load_balancer['LoadBalancerArn']}"
     
-    def get_all_classic_load_balancers(self) -> List[Dict]:
-        """Get all Classic Load Balancers."""
+    def get_all_classic_load_balancers(self) -> Iterator[Dict]:
+        """Yield all Classic Load Balancers, page by page."""
         try:
-            response = self.elb_client.describe_load_balancers()
-            return response.get('LoadBalancerDescriptions', [])
+            paginator = self.elb_client.get_paginator('describe_load_balancers')
+            for page in paginator.paginate(PaginationConfig={'PageSize': 400}):
+                yield from page.get('LoadBalancerDescriptions', [])
         except ClientError as e:
-            print(f"Error listing Classic ELBs: {e}")
-            return []
+            logger.error("Error listing Classic ELBs: %s", e)
     
     def is_classic_elb_inactive(self, load_balancer: Dict) -> bool:
         """
@@ -149,8 +396,9 @@ class LoadBalancerCleaner:
         Returns:
             True if older than min_age_days, False otherwise
         """
-        age_days = self.get_age_days(created_time)
-        return age_days >= self.min_age_days
+        if created_time.tzinfo is None:
+            created_time = created_time.replace(tzinfo=timezone.utc)
+        return created_time <= self._cutoff
     
     def get_elbv2_tags(self, load_balancer_arn: str) -> Dict[str, str]:
         """Get tags for an ELBv2 load balancer."""
@@ -161,7 +409,7 @@ class LoadBalancerCleaner:
                 return {tag['Key']: tag['Value'] for tag in tags}
             return {}
         except ClientError as e:
-            print(f"Error getting tags for {load_balancer_arn}: {e}")
+            logger.error("Error getting tags for %s: %s", load_balancer_arn, e)
             return {}
     
     def get_classic_elb_tags(self, load_balancer_name: str) -> Dict[str, str]:
@@ -173,9 +421,130 @@ class LoadBalancerCleaner:
                 return {tag['Key']: tag['Value'] for tag in tags}
             return {}
         except ClientError as e:
-            print(f"Error getting tags for {load_balancer_name}: {e}")
+            logger.error("Error getting tags for %s: %s", load_balancer_name, e)
             return {}
     
+    def _prefetch_elbv2_tags(self, load_balancer_arns: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Get tags for many ELBv2 load balancers, 20 ARNs per DescribeTags call.
+        
+        Args:
+            load_balancer_arns: ELBv2 ARNs to fetch tags for
+            
+        Returns:
+            Dictionary mapping load balancer ARN to its tag key-value pairs
+        """
+        tag_map = {}
+        for i in range(0, len(load_balancer_arns), _DESCRIBE_TAGS_BATCH_SIZE):
+            batch = load_balancer_arns[i:i + _DESCRIBE_TAGS_BATCH_SIZE]
+            try:
+                response = self.elbv2_client.describe_tags(ResourceArns=batch)
+                for description in response.get('TagDescriptions', []):
+                    tags = description.get('Tags', [])
+                    tag_map[description['ResourceArn']] = {tag['Key']: tag['Value'] for tag in tags}
+            except ClientError as e:
+                logger.warning("Error getting tags for ELBv2 batch, retrying one at a time: %s", e)
+                # An LB deleted mid-scan fails the whole batch, so look the rest up individually
+                for lb_arn in batch:
+                    tag_map[lb_arn] = self.get_elbv2_tags(lb_arn)
+        return tag_map
+    
+    def _prefetch_classic_tags(self, load_balancer_names: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Get tags for many Classic ELBs, 20 names per DescribeTags call.
+        
+        Args:
+            load_balancer_names: Classic ELB names to fetch tags for
+            
+        Returns:
+            Dictionary mapping load balancer name to its tag key-value pairs
+        """
+        tag_map = {}
+        for i in range(0, len(load_balancer_names), _DESCRIBE_TAGS_BATCH_SIZE):
+            batch = load_balancer_names[i:i + _DESCRIBE_TAGS_BATCH_SIZE]
+            try:
+                response = self.elb_client.describe_tags(LoadBalancerNames=batch)
+                for description in response.get('TagDescriptions', []):
+                    tags = description.get('Tags', [])
+                    tag_map[description['LoadBalancerName']] = {tag['Key']: tag['Value'] for tag in tags}
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'ValidationError':
+                    logger.error("Error getting tags for Classic ELB batch: %s", e)
+                    continue
+                # Fall back to one name at a time so one bad name doesn't hide the whole batch
+                for lb_name in batch:
+                    tag_map[lb_name] = self.get_classic_elb_tags(lb_name)
+        return tag_map
+    
+    def _get_tagged_arns(self) -> Optional[Set[str]]:
+        """
+        Get ARNs of all load balancers matching the tag filter in one paginated sweep.
+        
+        Uses the Resource Groups Tagging API so the tag match happens server-side
+        instead of one DescribeTags call per load balancer.
+        
+        Returns:
+            Set of matching load balancer ARNs (ELBv2 and Classic), or None if the
+            Tagging API is unreachable and the caller should fall back to DescribeTags
+        """
+        tag_filter = {
+            'Key': self.filter_tag_key,
+            'Values': [self.filter_tag_value] if self.filter_tag_value else []
+        }
+        try:
+            paginator = self.tagging_client.get_paginator('get_resources')
+            tagged_arns = set()
+            for page in paginator.paginate(
+                TagFilters=[tag_filter],
+                ResourceTypeFilters=['elasticloadbalancing:loadbalancer']
+            ):
+                for mapping in page.get('ResourceTagMappingList', []):
+                    tagged_arns.add(mapping['ResourceARN'])
+            logger.debug("Tagging API matched %d load balancer(s)", len(tagged_arns))
+            return tagged_arns
+        except (ClientError, BotoCoreError) as e:
+            logger.warning("Tagging API unavailable, falling back to per-load-balancer tag lookups: %s", e)
+            return None
+    
+    @staticmethod
+    def _classic_names_from_arns(arns: Set[str]) -> Set[str]:
+        """Extract Classic ELB names from ARNs of the form ...:loadbalancer/<name>."""
+        names = set()
+        for arn in arns:
+            _, sep, suffix = arn.partition(':loadbalancer/')
+            # ELBv2 ARNs continue with app/<name>/<id> or net/<name>/<id>
+            if sep and '/' not in suffix:
+                names.add(suffix)
+        return names
+    
+    def _tag_checker(self, load_balancers: List[Dict], tagged: Optional[Set[str]],
+                     classic: bool) -> Callable[[Dict], bool]:
+        """
+        Build the tag check for a batch of load balancers.
+        
+        Args:
+            load_balancers: Batch of at most 20 load balancers about to be checked
+            tagged: ARNs (ELBv2) or names (Classic) matched by the Tagging API,
+                or None to look tags up with one batched DescribeTags call
+            classic: True for Classic ELBs, False for ELBv2
+            
+        Returns:
+            tags_ok(load_balancer) -> bool
+        """
+        key = 'LoadBalancerName' if classic else 'LoadBalancerArn'
+        if not self.filter_tag_key:
+            return lambda lb: True
+        if tagged is not None:
+            return lambda lb: lb[key] in tagged
+        
+        prefetch = self._prefetch_classic_tags if classic else self._prefetch_elbv2_tags
+        tag_map = prefetch([lb[key] for lb in load_balancers])
+        return lambda lb: self.has_required_tag(tag_map.get(lb[key], {}))
+    
+    def _tag_filter_display(self) -> str:
+        """Human readable form of the tag filter, e.g. 'Owner=someone'."""
+        return f"{self.filter_tag_key}={self.filter_tag_value}" if self.filter_tag_value else self.filter_tag_key
+    
     def has_required_tag(self, tags: Dict[str, str]) -> bool:
         """
         Check if load balancer has the required tag.
@@ -198,21 +567,6 @@ class LoadBalancerCleaner:
         else:
             return True  # Tag key exists, value doesn't matter
     
-    def get_deletion_protection(self, load_balancer_arn: str) -> bool:
-        """Check if deletion protection is enabled on an ELBv2."""
-        try:
-            response = self.elbv2_client.describe_load_balancer_attributes(
-                LoadBalancerArn=load_balancer_arn
-            )
-            attributes = response.get('Attributes', [])
-            for attr in attributes:
-                if attr['Key'] == 'deletion_protection.enabled':
-                    return attr['Value'].lower() == 'true'
-            return False
-        except ClientError as e:
-            print(f"Error checking deletion protection for {load_balancer_arn}: {e}")
-            return False
-    
     def disable_deletion_protection(self, load_balancer_arn: str) -> bool:
         """Disable deletion protection on an ELBv2."""
         try:
@@ -227,44 +581,162 @@ class LoadBalancerCleaner:
             )
             return True
         except ClientError as e:
-            print(f"Error disabling deletion protection for {load_balancer_arn}: {e}")
+            logger.error("  Error disabling deletion protection for %s: %s", load_balancer_arn, e)
             return False
     
     def delete_elbv2(self, load_balancer_arn: str, check_protection: bool = True) -> bool:
-        """Delete an ELBv2 load balancer."""
-        if check_protection:
-            if self.get_deletion_protection(load_balancer_arn):
-                print(f"  Deletion protection enabled. Disabling it first...")
-                if not self.disable_deletion_protection(load_balancer_arn):
-                    print(f"  Failed to disable deletion protection. Skipping deletion.")
-                    return False
+        """
+        Delete an ELBv2 load balancer.
+        
+        Deletion is attempted first; deletion protection is only disabled (and the
+        delete retried) if AWS rejects the request because protection is enabled.
+        Failures are logged; the caller reports successful deletions.
+        """
+        try:
+            self.elbv2_client.delete_load_balancer(LoadBalancerArn=load_balancer_arn)
+            return True
+        except ClientError as e:
+            error = e.response.get('Error', {})
+            is_protected = (error.get('Code') == 'OperationNotPermitted'
+                            and 'deletion protection' in error.get('Message', '').lower())
+            if not (check_protection and is_protected):
+                logger.error("  ✗ Error deleting %s: %s", load_balancer_arn, e)
+                return False
+        
+        # A change to the LB besides the delete itself, so keep it visible under --quiet
+        logger.warning("  Deletion protection enabled on %s. Disabling it first...", load_balancer_arn)
+        if not self.disable_deletion_protection(load_balancer_arn):
+            logger.error("  Failed to disable deletion protection on %s. Skipping deletion.", load_balancer_arn)
+            return False
         
         try:
             self.elbv2_client.delete_load_balancer(LoadBalancerArn=load_balancer_arn)
-            print(f"  ✓ Deleted: {load_balancer_arn}")
             return True
         except ClientError as e:
-            print(f"  ✗ Error deleting {load_balancer_arn}: {e}")
+            logger.error("  ✗ Error deleting %s: %s", load_balancer_arn, e)
             return False
     
     def delete_classic_elb(self, load_balancer_name: str) -> bool:
-        """Delete a Classic ELB."""
+        """Delete a Classic ELB. Failures are logged; the caller reports successful deletions."""
         try:
             self.elb_client.delete_load_balancer(LoadBalancerName=load_balancer_name)
-            print(f"  ✓ Deleted: {load_balancer_name}")
             return True
         except ClientError as e:
-            print(f"  ✗ Error deleting {load_balancer_name}: {e}")
+            logger.error("  ✗ Error deleting %s: %s", load_balancer_name, e)
             return False
     
+    def _process_lbs(self, load_balancers: Iterable[Dict], stats: ScanStats,
+                     tagged: Optional[Set[str]], classic: bool) -> Iterator[Dict]:
+        """
+        Yield the load balancers that are old enough and match the tag filter.
+        
+        Checks run cheapest first: creation time, age and anything else the describe
+        response decides, then tags. Tags are only fetched for LBs that could be deleted.
+        Skipped load balancers are counted in stats.
+        
+        Args:
+            load_balancers: Load balancer descriptions, possibly a lazy generator
+            stats: ScanStats to fill in
+            tagged: Identifiers matched by the Tagging API, or None (see _tag_checker)
+            classic: True for Classic ELBs; every Classic LB yielded is already inactive
+        """
+        def prescreened():
+            for lb in load_balancers:
+                stats.total += 1
+                created_time = lb.get('CreatedTime')
+                if not created_time:
+                    stats.no_created += 1
+                    logger.info("  ⚠ Skipped %s: No creation time available", self._describe(lb))
+                    continue
+                if not self.is_older_than_threshold(created_time):
+                    age_days = self.get_age_days(created_time)
+                    stats.too_new.append((lb.get('LoadBalancerName', 'Unknown'), age_days))
+                    logger.info("  → Too new: %s (age: %.1f days, need %d days)",
+                                self._describe(lb), age_days, self.min_age_days)
+                    continue
+                # In use without needing an API call to find out
+                if classic and not self.is_classic_elb_inactive(lb):
+                    continue
+                if not classic and self._state_verdict(lb) is False:
+                    continue
+                yield lb
+        
+        # Consume in DescribeTags-sized batches so tag lookups keep pace with pagination
+        candidates = prescreened()
+        while True:
+            batch = list(islice(candidates, _DESCRIBE_TAGS_BATCH_SIZE))
+            if not batch:
+                break
+            tags_ok = self._tag_checker(batch, tagged, classic)
+            for lb in batch:
+                if not tags_ok(lb):
+                    stats.no_tag += 1
+                    logger.info("  ⊘ Skipped (tag mismatch): %s", self._describe(lb))
+                    continue
+                yield lb
+        
+        print(f"Found {stats.total} {stats.label} load balancer(s)")
+    
+    def _mark_inactive(self, stats: ScanStats, load_balancer: Dict, age_days: float):
+        """Record an inactive load balancer that is eligible for deletion."""
+        stats.inactive.append(load_balancer)
+        logger.info("  → Inactive & eligible: %s (age: %.1f days)", self._describe(load_balancer), age_days)
+    
+    def _delete_inactive(self, stats: ScanStats, delete: Callable[[Dict], bool]) -> Tuple[int, int]:
+        """
+        Delete (or in dry-run mode, list) the inactive load balancers in stats.
+        
+        Returns:
+            (deleted_count, skipped_count)
+        """
+        if not stats.inactive:
+            print(f"No inactive {stats.label} load balancers found that are older than {self.min_age_days} days.")
+            return 0, 0
+        
+        print(f"\nFound {len(stats.inactive)} inactive {stats.label} load balancer(s) older than {self.min_age_days} days")
+        if self.dry_run:
+            for lb in stats.inactive:
+                age_days = self.get_age_days(lb['CreatedTime'])
+                print(f"  [DRY RUN] Would delete: {self._describe(lb)} - age: {age_days:.1f} days")
+            return 0, 0
+        
+        def delete_one(lb: Dict) -> Tuple[Dict, bool]:
+            logger.info("  Deleting: %s", self._describe(lb))
+            return lb, delete(lb)
+        
+        # Deletes are independent API calls; ELBv2 listeners cascade with the LB
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(delete_one, stats.inactive))
+        
+        # The record of what was destroyed goes to stdout from this thread only, so
+        # lines can't interleave and --quiet can't hide it
+        deleted = 0
+        for lb, ok in results:
+            age_days = self.get_age_days(lb['CreatedTime'])
+            if ok:
+                deleted += 1
+                print(f"  ✓ Deleted: {self._describe(lb)} (age: {age_days:.1f} days)")
+            else:
+                print(f"  ✗ Failed to delete: {self._describe(lb)} (age: {age_days:.1f} days)")
+        return deleted, len(results) - deleted
+    
+    def _print_notes(self, stats: ScanStats):
+        """Print the per-type notes about load balancers that were not eligible."""
+        if stats.too_new:
+            print(f"\nNote: {len(stats.too_new)} {stats.label} load balancer(s) are too new to consider (need {self.min_age_days} days)")
+        if stats.no_created > 0:
+            print(f"\nNote: {stats.no_created} {stats.label} load balancer(s) skipped (no creation time available)")
+        if stats.no_tag > 0:
+            print(f"\nNote: {stats.no_tag} {stats.label} deletion candidate(s) skipped (tag filter mismatch: {self._tag_filter_display()}; "
+                  f"tags are only checked on LBs old enough to delete and not known to be in use)")
+    
     def find_and_delete_inactive_lbs(self, check_protection: bool = True):
         """Find and delete all inactive load balancers older than min_age_days with required tag."""
         print(f"\n{'='*70}")
         print(f"Scanning for inactive load balancers in region: {self.region}")
         print(f"Minimum age for deletion: {self.min_age_days} days")
         if self.filter_tag_key:
-            tag_filter = f"{self.filter_tag_key}={self.filter_tag_value}" if self.filter_tag_value else self.filter_tag_key
-            print(f"Tag filter: {tag_filter}")
+            print(f"Tag filter: {self._tag_filter_display()}")
         else:
             print("Tag filter: None (all load balancers)")
         print(f"Mode: {'DRY RUN (no deletions)' if self.dry_run else 'DELETE MODE'}")
@@ -273,156 +745,64 @@ class LoadBalancerCleaner:
         deleted_count = 0
         skipped_count = 0
         
+        # Results from an earlier scan must not decide a deletion in this one
+        self._reset_caches()
+        
+        # Match tags server-side in one sweep; None means fall back to DescribeTags
+        tagged_arns = self._get_tagged_arns() if self.filter_tag_key else None
+        
         # Process ELBv2 (ALB/NLB)
         print("\n[1/2] Checking ELBv2 Load Balancers (ALB/NLB)...")
-        elbv2_lbs = self.get_all_load_balancers_v2()
-        print(f"Found {len(elbv2_lbs)} ELBv2 load balancer(s)")
-        
-        inactive_elbv2 = []
-        too_new_elbv2 = []
-        skipped_no_created_time = 0
-        skipped_no_tag = 0
-        for lb in elbv2_lbs:
-            lb_name = lb.get('LoadBalancerName', 'Unknown')
-            lb_arn = lb.get('LoadBalancerArn', 'Unknown')
-            lb_type = lb.get('Type', 'Unknown')
-            created_time = lb.get('CreatedTime')
-            
-            # Check tags first
-            tags = self.get_elbv2_tags(lb_arn)
-            if not self.has_required_tag(tags):
-                skipped_no_tag += 1
-                tag_display = f"{self.filter_tag_key}={tags.get(self.filter_tag_key, 'N/A')}" if self.filter_tag_key else "N/A"
-                print(f"  ⊘ Skipped (tag mismatch): {lb_name} ({lb_type}) - tag: {tag_display}")
-                continue
-            
-            if created_time:
-                age_days = self.get_age_days(created_time)
-                is_inactive = self.is_elbv2_inactive(lb)
-                is_old_enough = self.is_older_than_threshold(created_time)
-                
+        elbv2_stats = ScanStats('ELBv2')
+        candidates = self._process_lbs(self.get_all_load_balancers_v2(), elbv2_stats, tagged_arns, classic=False)
+        try:
+            for lb, is_inactive, age_days in self._check_elbv2_all(candidates):
                 if is_inactive:
-                    if is_old_enough:
-                        inactive_elbv2.append(lb)
-                        print(f"  → Inactive & eligible: {lb_name} ({lb_type}) - {lb_arn} (age: {age_days:.1f} days)")
-                    else:
-                        too_new_elbv2.append((lb_name, age_days))
-                        print(f"  → Inactive but too new: {lb_name} ({lb_type}) - {lb_arn} (age: {age_days:.1f} days, need {self.min_age_days} days)")
-            else:
-                skipped_no_created_time += 1
-                print(f"  ⚠ Skipped {lb_name} ({lb_type}): No creation time available")
-        
-        if inactive_elbv2:
-            print(f"\nFound {len(inactive_elbv2)} inactive ELBv2 load balancer(s) older than {self.min_age_days} days")
-            for lb in inactive_elbv2:
-                lb_name = lb.get('LoadBalancerName', 'Unknown')
-                lb_arn = lb.get('LoadBalancerArn', 'Unknown')
-                created_time = lb.get('CreatedTime')
-                age_days = self.get_age_days(created_time) if created_time else 0
-                
-                if self.dry_run:
-                    print(f"  [DRY RUN] Would delete: {lb_name} ({lb_arn}) - age: {age_days:.1f} days")
-                else:
-                    print(f"\nDeleting: {lb_name} (age: {age_days:.1f} days)")
-                    if self.delete_elbv2(lb_arn, check_protection):
-                        deleted_count += 1
-                    else:
-                        skipped_count += 1
-        else:
-            print("No inactive ELBv2 load balancers found that are older than {} days.".format(self.min_age_days))
-        
-        if too_new_elbv2:
-            print(f"\nNote: {len(too_new_elbv2)} inactive ELBv2 load balancer(s) are too new to delete (need {self.min_age_days} days)")
-        if skipped_no_created_time > 0:
-            print(f"\nNote: {skipped_no_created_time} ELBv2 load balancer(s) skipped (no creation time available)")
-        if skipped_no_tag > 0:
-            tag_filter = f"{self.filter_tag_key}={self.filter_tag_value}" if self.filter_tag_key and self.filter_tag_value else self.filter_tag_key
-            print(f"\nNote: {skipped_no_tag} ELBv2 load balancer(s) skipped (tag filter mismatch: {tag_filter})")
+                    self._mark_inactive(elbv2_stats, lb, age_days)
+        finally:
+            # Only the ELBv2 checks use the target health pool
+            self._shutdown_health_executor()
+        deleted, skipped = self._delete_inactive(
+            elbv2_stats, lambda lb: self.delete_elbv2(lb['LoadBalancerArn'], check_protection)
+        )
+        deleted_count += deleted
+        skipped_count += skipped
+        self._print_notes(elbv2_stats)
         
         # Process Classic ELB
         print("\n[2/2] Checking Classic Load Balancers...")
-        classic_lbs = self.get_all_classic_load_balancers()
-        print(f"Found {len(classic_lbs)} Classic load balancer(s)")
-        
-        inactive_classic = []
-        too_new_classic = []
-        skipped_no_created_time_classic = 0
-        skipped_no_tag_classic = 0
-        for lb in classic_lbs:
-            lb_name = lb.get('LoadBalancerName', 'Unknown')
-            instance_count = len(lb.get('Instances', []))
-            created_time = lb.get('CreatedTime')
-            
-            # Check tags first
-            tags = self.get_classic_elb_tags(lb_name)
-            if not self.has_required_tag(tags):
-                skipped_no_tag_classic += 1
-                tag_display = f"{self.filter_tag_key}={tags.get(self.filter_tag_key, 'N/A')}" if self.filter_tag_key else "N/A"
-                print(f"  ⊘ Skipped (tag mismatch): {lb_name} - tag: {tag_display}")
-                continue
-            
-            if created_time:
-                age_days = self.get_age_days(created_time)
-                is_inactive = self.is_classic_elb_inactive(lb)
-                is_old_enough = self.is_older_than_threshold(created_time)
-                
-                if is_inactive:
-                    if is_old_enough:
-                        inactive_classic.append(lb)
-                        print(f"  → Inactive & eligible: {lb_name} (0 instances, age: {age_days:.1f} days)")
-                    else:
-                        too_new_classic.append((lb_name, age_days))
-                        print(f"  → Inactive but too new: {lb_name} (0 instances, age: {age_days:.1f} days, need {self.min_age_days} days)")
-            else:
-                skipped_no_created_time_classic += 1
-                print(f"  ⚠ Skipped {lb_name}: No creation time available")
-        
-        if inactive_classic:
-            print(f"\nFound {len(inactive_classic)} inactive Classic load balancer(s) older than {self.min_age_days} days")
-            for lb in inactive_classic:
-                lb_name = lb.get('LoadBalancerName', 'Unknown')
-                created_time = lb.get('CreatedTime')
-                age_days = self.get_age_days(created_time) if created_time else 0
-                
-                if self.dry_run:
-                    print(f"  [DRY RUN] Would delete: {lb_name} - age: {age_days:.1f} days")
-                else:
-                    print(f"\nDeleting: {lb_name} (age: {age_days:.1f} days)")
-                    if self.delete_classic_elb(lb_name):
-                        deleted_count += 1
-                    else:
-                        skipped_count += 1
-        else:
-            print("No inactive Classic load balancers found that are older than {} days.".format(self.min_age_days))
-        
-        if too_new_classic:
-            print(f"\nNote: {len(too_new_classic)} inactive Classic load balancer(s) are too new to delete (need {self.min_age_days} days)")
-        if skipped_no_created_time_classic > 0:
-            print(f"\nNote: {skipped_no_created_time_classic} Classic load balancer(s) skipped (no creation time available)")
-        if skipped_no_tag_classic > 0:
-            tag_filter = f"{self.filter_tag_key}={self.filter_tag_value}" if self.filter_tag_key and self.filter_tag_value else self.filter_tag_key
-            print(f"\nNote: {skipped_no_tag_classic} Classic load balancer(s) skipped (tag filter mismatch: {tag_filter})")
+        classic_stats = ScanStats('Classic')
+        tagged_names = self._classic_names_from_arns(tagged_arns) if tagged_arns is not None else None
+        # The Classic check is a local Instances count, so it runs inline inside _process_lbs
+        for lb in self._process_lbs(self.get_all_classic_load_balancers(), classic_stats, tagged_names, classic=True):
+            self._mark_inactive(classic_stats, lb, self.get_age_days(lb['CreatedTime']))
+        deleted, skipped = self._delete_inactive(
+            classic_stats, lambda lb: self.delete_classic_elb(lb['LoadBalancerName'])
+        )
+        deleted_count += deleted
+        skipped_count += skipped
+        self._print_notes(classic_stats)
         
         # Summary
+        all_stats = (elbv2_stats, classic_stats)
         print(f"\n{'='*70}")
         print("SUMMARY")
         print(f"{'='*70}")
         if self.dry_run:
-            total_inactive = len(inactive_elbv2) + len(inactive_classic)
+            total_inactive = sum(len(stats.inactive) for stats in all_stats)
             print(f"Total inactive load balancers (older than {self.min_age_days} days): {total_inactive}")
-            print(f"  - ELBv2: {len(inactive_elbv2)}")
-            print(f"  - Classic: {len(inactive_classic)}")
-            total_too_new = len(too_new_elbv2) + len(too_new_classic)
+            for stats in all_stats:
+                print(f"  - {stats.label}: {len(stats.inactive)}")
+            total_too_new = sum(len(stats.too_new) for stats in all_stats)
             if total_too_new > 0:
-                print(f"\nInactive but too new (< {self.min_age_days} days): {total_too_new}")
-                print(f"  - ELBv2: {len(too_new_elbv2)}")
-                print(f"  - Classic: {len(too_new_classic)}")
-            total_skipped_tag = skipped_no_tag + skipped_no_tag_classic
+                print(f"\nToo new to consider (< {self.min_age_days} days): {total_too_new}")
+                for stats in all_stats:
+                    print(f"  - {stats.label}: {len(stats.too_new)}")
+            total_skipped_tag = sum(stats.no_tag for stats in all_stats)
             if total_skipped_tag > 0 and self.filter_tag_key:
-                tag_filter = f"{self.filter_tag_key}={self.filter_tag_value}" if self.filter_tag_value else self.filter_tag_key
-                print(f"\nSkipped due to tag filter ({tag_filter}): {total_skipped_tag}")
-                print(f"  - ELBv2: {skipped_no_tag}")
-                print(f"  - Classic: {skipped_no_tag_classic}")
+                print(f"\nDeletion candidates skipped due to tag filter ({self._tag_filter_display()}): {total_skipped_tag}")
+                for stats in all_stats:
+                    print(f"  - {stats.label}: {stats.no_tag}")
             print("\nRun with --no-dry-run to actually delete these load balancers.")
         else:
             print(f"Deleted: {deleted_count}")
@@ -452,7 +832,10 @@ Examples:
   # Disable tag filtering (process all load balancers)
   python delete_inactive_load_balancers.py --region us-east-1 --no-tag-filter --no-dry-run
 
-  # Skip deletion protection check (faster but may fail if protection is enabled)
+  # Check target health with aioboto3 instead of a thread pool
+  python delete_inactive_load_balancers.py --region us-east-1 --async
+
+  # Don't disable deletion protection (protected load balancers are skipped)
   python delete_inactive_load_balancers.py --region us-east-1 --no-dry-run --skip-protection-check
         """
     )
@@ -481,7 +864,7 @@ Examples:
         '--skip-protection-check',
         action='store_true',
         default=False,
-        help='Skip checking and disabling deletion protection (faster but may fail)'
+        help='Do not disable deletion protection; protected load balancers fail to delete'
     )
     
     parser.add_argument(
@@ -505,13 +888,64 @@ Examples:
         help='Disable tag filtering (process all load balancers regardless of tags)'
     )
     
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=10,
+        help='Number of load balancers to check concurrently (default: 10)'
+    )
+    
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        default=False,
+        help=f'Check target health with aioboto3 ({_ASYNC_CONCURRENCY} requests in flight) instead of threads'
+    )
+    
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        default=False,
+        help='Also show debug output'
+    )
+    verbosity.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        default=False,
+        help='Hide per-load-balancer scan progress (summaries are still printed)'
+    )
+    
     args = parser.parse_args()
     
+    if args.verbose:
+        log_level = logging.DEBUG
+    elif args.quiet:
+        log_level = logging.WARNING
+    else:
+        log_level = logging.INFO
+    # Configure only our logger; botocore/urllib3 debug records include request headers
+    # (Authorization, X-Amz-Security-Token) and must stay at the root WARNING default
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(log_level)
+    logger.propagate = False
+    
     # Validate min_age_days
     if args.min_age_days < 0:
         print("Error: --min-age-days must be non-negative")
         sys.exit(1)
     
+    if args.max_workers < 1:
+        print("Error: --max-workers must be at least 1")
+        sys.exit(1)
+    
+    if args.use_async and aioboto3 is None:
+        print("Error: --async requires aioboto3 (pip install aioboto3)")
+        sys.exit(1)
+    
     # Set tag filter parameters
     tag_key = None if args.no_tag_filter else args.filter_tag_key
     tag_value = None if args.no_tag_filter else args.filter_tag_value
@@ -538,7 +972,9 @@ Examples:
         dry_run=not args.no_dry_run,
         min_age_days=args.min_age_days,
         filter_tag_key=tag_key,
-        filter_tag_value=tag_value
+        filter_tag_value=tag_value,
+        max_workers=args.max_workers,
+        use_async=args.use_async
     )
     
     cleaner.find_and_delete_inactive_lbs(check_protection=not args.skip_protection_check)